@@ -1,11 +1,14 @@
 import sqlite3
 import datetime
-import random
+import numpy as np
 
 # Create a new SQLite database
 conn = sqlite3.connect('business.db')
 cursor = conn.cursor()
 
+# Tune SQLite for a one-off bulk load (journal_mode persists in the file, so it is reset after loading)
+cursor.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;")
+
 # Create tables
 cursor.execute('''
 CREATE TABLE IF NOT EXISTS customers (
@@ -40,6 +43,11 @@ CREATE TABLE IF NOT EXISTS sales (
 )
 ''')
 
+# Index the columns used by the analytics joins and date filters
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_sales_customer ON sales(customer_id)")
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_sales_product ON sales(product_id)")
+cursor.execute("CREATE INDEX IF NOT EXISTS idx_sales_date ON sales(sale_date)")
+
 # Sample data
 customers_data = [
     ('John Doe', 'john@example.com', 'North', '2023-01-15'),
@@ -60,34 +68,36 @@ products_data = [
     ('Filing Cabinet', 'Furniture', 149.99, 40)
 ]
 
-# Insert sample data
-cursor.executemany('INSERT INTO customers (name, email, region, join_date) VALUES (?, ?, ?, ?)', customers_data)
-cursor.executemany('INSERT INTO products (name, category, price, stock) VALUES (?, ?, ?, ?)', products_data)
-
 # Generate sample sales data
 start_date = datetime.date(2023, 1, 1)
 end_date = datetime.date(2024, 3, 31)
 days_between = (end_date - start_date).days
 
-sales_data = []
-for _ in range(200):  # Generate 200 sales records
-    random_days = random.randint(0, days_between)
-    sale_date = start_date + datetime.timedelta(days=random_days)
-    customer_id = random.randint(1, len(customers_data))
-    product_id = random.randint(1, len(products_data))
-    quantity = random.randint(1, 5)
-    
-    # Get product price
-    cursor.execute('SELECT price FROM products WHERE product_id = ?', (product_id,))
-    price = cursor.fetchone()[0]
-    total_amount = price * quantity
-    
-    sales_data.append((customer_id, product_id, quantity, sale_date, total_amount))
-
-cursor.executemany('INSERT INTO sales (customer_id, product_id, quantity, sale_date, total_amount) VALUES (?, ?, ?, ?, ?)', sales_data)
-
-# Commit changes and close connection
-conn.commit()
+# Look up prices from the in-memory product list and generate all sales at once
+prices = np.array([p[2] for p in products_data])
+n_sales = 200  # Generate 200 sales records
+customer_ids = np.random.randint(1, len(customers_data) + 1, n_sales)
+product_ids = np.random.randint(1, len(prices) + 1, n_sales)
+quantities = np.random.randint(1, 6, n_sales)
+random_days = np.random.randint(0, days_between + 1, n_sales)
+sale_dates = [start_date + datetime.timedelta(days=int(d)) for d in random_days]
+total_amounts = prices[product_ids - 1] * quantities
+
+sales_data = list(zip(customer_ids.tolist(), product_ids.tolist(), quantities.tolist(), sale_dates, total_amounts.tolist()))
+
+# Insert sample data in a single transaction
+with conn:
+    cursor.executemany('INSERT INTO customers (name, email, region, join_date) VALUES (?, ?, ?, ?)', customers_data)
+    cursor.executemany('INSERT INTO products (name, category, price, stock) VALUES (?, ?, ?, ?)', products_data)
+    cursor.executemany('INSERT INTO sales (customer_id, product_id, quantity, sale_date, total_amount) VALUES (?, ?, ?, ?, ?)', sales_data)
+
+# Refresh planner statistics now that the tables are populated
+cursor.execute("ANALYZE")
+
+# Restore the default rollback journal so readers don't need write access for -wal/-shm files
+cursor.execute("PRAGMA journal_mode=DELETE")
+
+# Close connection
 conn.close()
 
 print("Database created successfully with sample data!") 